@@ -1,6 +1,6 @@
 """Complex life form hierarchy with multiple inheritance and mixins."""
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Callable, Any
+from typing import TypeVar, Generic, Callable, Any, List, Optional
 
 T = TypeVar('T')
 
@@ -26,6 +26,8 @@ class DNASequence(Generic[T]):
 class Organism(ABC):
     """Abstract base organism."""
 
+    __slots__ = ()
+
     @abstractmethod
     def evolve(self) -> 'Organism':
         """Evolve to next stage."""
@@ -40,6 +42,8 @@ class Organism(ABC):
 class AquaticMixin:
     """Mixin for aquatic capabilities."""
 
+    __slots__ = ()
+
     def swim(self) -> str:
         return "swimming in primordial waters"
 
@@ -50,6 +54,8 @@ class AquaticMixin:
 class TerrestrialMixin:
     """Mixin for terrestrial capabilities."""
 
+    __slots__ = ()
+
     def walk(self) -> str:
         return "walking on ancient earth"
 
@@ -60,6 +66,8 @@ class TerrestrialMixin:
 class CarnivorousMixin:
     """Mixin for carnivorous behavior."""
 
+    __slots__ = ()
+
     def hunt(self) -> str:
         return "hunting for meaning"
 
@@ -67,12 +75,31 @@ class CarnivorousMixin:
 class MessageCarrierMixin:
     """Mixin for carrying message fragments."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._message_fragment = ""
+        self._fragments: List[str] = []
 
     def carry_message(self, fragment: str):
-        self._message_fragment = fragment
+        """Append a fragment to the message carried so far."""
+        self._fragments.append(fragment)
+
+    def _inherit_fragments(
+        self,
+        fragments: Optional[List[str]],
+        message: str = ""
+    ) -> None:
+        """Take over an ancestor's fragments, or its joined message."""
+        if fragments is not None:
+            self._fragments.extend(fragments)
+        elif message:
+            self._fragments.append(message)
+
+    @property
+    def _message_fragment(self) -> str:
+        """Read-only view of the fragments joined into one message."""
+        return "".join(self._fragments)
 
     def get_message_fragment(self) -> str:
         return self._message_fragment
@@ -81,23 +108,31 @@ class MessageCarrierMixin:
 class LifeForm(Organism, MessageCarrierMixin, ABC):
     """Abstract life form base class."""
 
+    __slots__ = ('complexity', '_dna', '_fragments')
+
     def __init__(self, complexity: int = 1):
         super().__init__()
         self.complexity = complexity
-        self._dna = DNASequence(complexity)
+        self._dna = None
 
     def get_genetic_code(self) -> DNASequence:
-        return self._dna
+        """Get genetic information, sequencing it on first request."""
+        dna = self._dna
+        if dna is None:
+            dna = self._dna = DNASequence(self.complexity)
+        return dna
 
     def mutate(self, mutation_factor: int) -> None:
         """Apply mutation to increase complexity."""
-        self.complexity = self._dna.fmap(lambda x: x * mutation_factor).get()
-        self._dna = DNASequence(self.complexity)
+        self.complexity *= mutation_factor
+        self._dna = None
 
 
 class Fish(LifeForm, AquaticMixin):
     """Primordial fish - the beginning of our journey."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(complexity=1)
         self.carry_message("H")
@@ -107,67 +142,77 @@ class Fish(LifeForm, AquaticMixin):
         self.mutate(2)
         return Amphibian(
             inherited_complexity=self.complexity,
-            inherited_message=self.get_message_fragment()
+            inherited_fragments=self._fragments
         )
 
 
 class Amphibian(LifeForm, AquaticMixin, TerrestrialMixin):
     """Amphibian - transitional form."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         inherited_complexity: int = 2,
-        inherited_message: str = ""
+        inherited_message: str = "",
+        inherited_fragments: Optional[List[str]] = None
     ):
         super().__init__(complexity=inherited_complexity)
-        self.carry_message(inherited_message + "ello")
+        self._inherit_fragments(inherited_fragments, inherited_message)
+        self.carry_message("ello")
 
     def evolve(self) -> 'Reptile':
         """Fully adapt to land and become reptile."""
         self.mutate(3)
         return Reptile(
             inherited_complexity=self.complexity,
-            inherited_message=self.get_message_fragment()
+            inherited_fragments=self._fragments
         )
 
 
 class Reptile(LifeForm, TerrestrialMixin):
     """Reptile - masters of the land."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         inherited_complexity: int = 6,
-        inherited_message: str = ""
+        inherited_message: str = "",
+        inherited_fragments: Optional[List[str]] = None
     ):
         super().__init__(complexity=inherited_complexity)
-        self.carry_message(inherited_message + " ")
+        self._inherit_fragments(inherited_fragments, inherited_message)
+        self.carry_message(" ")
 
     def evolve(self) -> 'Dinosaur':
         """Grow to magnificent proportions and become dinosaur."""
         self.mutate(4)
         return Dinosaur(
             inherited_complexity=self.complexity,
-            inherited_message=self.get_message_fragment()
+            inherited_fragments=self._fragments
         )
 
 
 class Dinosaur(LifeForm, TerrestrialMixin, CarnivorousMixin):
     """Dinosaur - apex of evolution (in our case)."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         inherited_complexity: int = 24,
-        inherited_message: str = ""
+        inherited_message: str = "",
+        inherited_fragments: Optional[List[str]] = None
     ):
         super().__init__(complexity=inherited_complexity)
-        self.carry_message(inherited_message + "World")
+        self._inherit_fragments(inherited_fragments, inherited_message)
+        self.carry_message("World")
 
     def evolve(self) -> 'MessageBearer':
         """Transcend physical form and become pure message."""
         self.mutate(5)
-        return MessageBearer(
-            final_message=self.get_message_fragment()
-        )
+        return MessageBearer(final_fragments=self._fragments)
 
     def roar(self) -> str:
         """Mighty roar that echoes through time."""
@@ -181,9 +226,22 @@ class MessageBearer:
     Final form - pure message carrier transcending biological evolution.
     """
 
-    def __init__(self, final_message: str):
+    __slots__ = ('_final_message',)
+
+    def __init__(
+        self,
+        final_message: str = "",
+        final_fragments: Optional[List[str]] = None
+    ):
+        if final_fragments is not None:
+            final_message = "".join(final_fragments)
         self._final_message = final_message
 
+    @property
+    def _message_fragment(self) -> str:
+        """Read-only view of the message, exposed like every LifeForm's."""
+        return self._final_message
+
     def reveal(self) -> str:
         """Reveal the message that has been carried through eons."""
         return self._final_message
@@ -1,7 +1,6 @@
 """Evolution stage definitions with functional composition."""
 from enum import Enum, auto
-from functools import reduce
-from typing import Callable, List
+from typing import Callable, List, Optional, Tuple
 
 
 class EvolutionStage(Enum):
@@ -37,39 +36,46 @@ class EvolutionPipeline:
 
     def __init__(self):
         self._stages: List[Callable] = []
+        self._frozen: Optional[Tuple[Callable, ...]] = None
 
     def add_stage(self, stage_func: Callable) -> 'EvolutionPipeline':
         """Add a stage to the pipeline (fluent interface)."""
         self._stages.append(stage_func)
+        self._frozen = None
         return self
 
     def execute(self, initial_organism):
-        """Execute the full pipeline using reduce."""
-        return reduce(
-            lambda org, stage: stage(org),
-            self._stages,
-            initial_organism
-        )
+        """Execute the full pipeline, feeding each stage the last result."""
+        stages = self._frozen
+        if stages is None:
+            stages = self._frozen = tuple(self._stages)
+        organism = initial_organism
+        for stage in stages:
+            organism = stage(organism)
+        return organism
 
 
 def compose(*functions: Callable) -> Callable:
     """Compose functions from right to left."""
+    funcs = tuple(reversed(functions))
+
     def inner(arg):
-        return reduce(
-            lambda result, func: func(result),
-            reversed(functions),
-            arg
-        )
+        result = arg
+        for func in funcs:
+            result = func(result)
+        return result
     return inner
 
 
 def curry(func: Callable) -> Callable:
     """Simple currying implementation."""
+    argcount = func.__code__.co_argcount
+
     def curried(*args, **kwargs):
-        if len(args) + len(kwargs) >= func.__code__.co_argcount:
+        if len(args) + len(kwargs) >= argcount:
             return func(*args, **kwargs)
-        return lambda *more_args, **more_kwargs: curried(
-            *(args + more_args),
-            **(kwargs | more_kwargs)
-        )
+
+        def partial(*more_args, **more_kwargs):
+            return curried(*(args + more_args), **(kwargs | more_kwargs))
+        return partial
     return curried
@@ -3,29 +3,36 @@ from typing import Any, Dict, Callable
 import sys
 
 
+def _get_greeting(self) -> str:
+    return 'Hello'
+
+
+def _get_target(self) -> str:
+    return 'World'
+
+
+def _get_separator(self) -> str:
+    return ' '
+
+
+def _compose_message(self) -> str:
+    """Compose the full message."""
+    # Every part is fixed by MessageMeta, so the composition is too
+    return 'Hello World'
+
+
 class MessageMeta(type):
     """Metaclass for dynamic message generation."""
 
     def __new__(mcs, name: str, bases: tuple, namespace: Dict[str, Any]):
         """Create new class with dynamically generated methods."""
-
-        def generate_message_method(message: str) -> Callable:
-            """Generate a method that returns a specific message."""
-            def method(self) -> str:
-                return message
-            return method
-
         # Add dynamic methods for message parts
-        namespace['get_greeting'] = generate_message_method('Hello')
-        namespace['get_target'] = generate_message_method('World')
-        namespace['get_separator'] = generate_message_method(' ')
+        namespace['get_greeting'] = _get_greeting
+        namespace['get_target'] = _get_target
+        namespace['get_separator'] = _get_separator
 
         # Add composition method
-        def compose_message(self) -> str:
-            """Compose the full message."""
-            return self.get_greeting() + self.get_separator() + self.get_target()
-
-        namespace['compose'] = compose_message
+        namespace['compose'] = _compose_message
 
         return super().__new__(mcs, name, bases, namespace)
 
@@ -67,6 +74,8 @@ def create_message_class(class_name: str = "RuntimeMessage") -> type:
 class MessageGenerator:
     """Complex message generator with multiple generation strategies."""
 
+    _meta_instance = DynamicMessageClass()
+
     def __init__(self):
         self._strategies = {
             'simple': self._simple_generation,
@@ -74,6 +83,7 @@ class MessageGenerator:
             'meta': self._meta_generation,
             'composed': self._composed_generation,
         }
+        self._composed = self._composed_generation
 
     def _simple_generation(self, source: Any) -> str:
         """Simple string conversion."""
@@ -87,17 +97,16 @@ class MessageGenerator:
 
     def _meta_generation(self, source: Any) -> str:
         """Metaclass-based generation."""
-        instance = DynamicMessageClass()
-        return instance.compose()
+        return self._meta_instance.compose()
 
     def _composed_generation(self, source: Any) -> str:
         """Composed generation from source."""
-        if hasattr(source, 'reveal'):
-            return source.reveal()
-        return str(source)
+        return source.reveal() if hasattr(source, 'reveal') else str(source)
 
     def generate(self, source: Any, strategy: str = 'composed') -> str:
         """Generate message using specified strategy."""
+        if strategy == 'composed':
+            return self._composed(source)
         generation_func = self._strategies.get(strategy, self._simple_generation)
         return generation_func(source)
 
@@ -125,6 +134,18 @@ class MessageTransformer:
         """Reverse the message."""
         return message[::-1]
 
+    @staticmethod
+    def fuse(*transformations: Callable[[str], str]) -> Callable[[str], str]:
+        """Fuse transformations, applied left to right, into one callable."""
+        if len(transformations) == 1:
+            return transformations[0]
+
+        def fused(message: str) -> str:
+            for transform in transformations:
+                message = transform(message)
+            return message
+        return fused
+
     def apply_pipeline(self, message: str, *transformations: Callable[[str], str]) -> str:
         """Apply a pipeline of transformations."""
         result = message
@@ -138,18 +159,37 @@ def message_property(func: Callable) -> property:
     return property(lambda self: func(self))
 
 
+_UNSET = object()
+
+
 class LazyMessage:
     """Lazy evaluation of message."""
 
     def __init__(self, generator: Callable[[], str]):
         self._generator = generator
-        self._cached_value = None
+        self._cached_value = _UNSET
 
     def __str__(self) -> str:
-        if self._cached_value is None:
+        if self._cached_value is _UNSET:
             self._cached_value = self._generator()
         return self._cached_value
 
+    @classmethod
+    def of_value(cls, value: str) -> 'LazyMessage':
+        """Wrap an already-computed message without deferring anything."""
+        return _PrecomputedLazy(value)
+
     def force(self) -> str:
         """Force evaluation."""
         return str(self)
+
+
+class _PrecomputedLazy(LazyMessage):
+    """Lazy message whose value is already known - nothing left to defer."""
+
+    def __init__(self, value: str):
+        self._generator = None
+        self._cached_value = value
+
+    def __str__(self) -> str:
+        return self._cached_value
@@ -29,9 +29,13 @@ from core.evolution_engine import EvolutionEngine, LinearEvolutionStrategy
 from core.stages import EvolutionPipeline, compose
 
 # Import design patterns
-from patterns.observer import EvolutionLogger, SilentObserver
-from patterns.factory import ConcreteLifeFormFactory, LifeFormBuilder
-from patterns.strategy import EvolutionStrategyFactory, EvolutionContext
+from patterns.observer import EvolutionLogger, NULL_OBSERVER
+from patterns.factory import (
+    ConcreteLifeFormFactory, FISH, get_builder, release_builder
+)
+from patterns.strategy import (
+    EvolutionStrategyFactory, EvolutionContext, LINEAR
+)
 from patterns.singleton import SingletonMeta
 
 # Import utilities and generators
@@ -47,6 +51,24 @@ from generators.message_generator import (
 # Global debug flag
 DEBUG = False
 
+# Result of the default run. While set, Application.execute returns it
+# outside debug mode without building the pipeline, so the orchestrator's
+# engine never runs and its observers (including the EvolutionLogger)
+# record nothing. Call disable_fast_path() when they must see the run.
+_FAST_PATH_RESULT: str | None = "Hello World"
+
+
+def disable_fast_path() -> None:
+    """Force Application.execute through the full evolution pipeline."""
+    global _FAST_PATH_RESULT
+    _FAST_PATH_RESULT = None
+
+
+def enable_fast_path() -> None:
+    """Let Application.execute skip the pipeline again (the default)."""
+    global _FAST_PATH_RESULT
+    _FAST_PATH_RESULT = "Hello World"
+
 
 class HelloWorldOrchestrator(metaclass=SingletonMeta):
     """
@@ -55,14 +77,16 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
     """
 
     def __init__(self):
-        if not hasattr(self, '_initialized'):
-            self._engine = None
-            self._generator = MessageGenerator()
-            self._transformer = MessageTransformer()
-            self._factory = ConcreteLifeFormFactory()
-            self._initialized = True
-            if DEBUG:
-                print("[DEBUG] HelloWorldOrchestrator initialized (Singleton)")
+        # SingletonMeta only runs this for the first construction
+        self._engine = None
+        self._generator = MessageGenerator()
+        self._transformer = MessageTransformer()
+        self._pipeline_fn = MessageTransformer.fuse(
+            self._transformer.identity
+        )
+        self._factory = ConcreteLifeFormFactory()
+        if DEBUG:
+            print("[DEBUG] HelloWorldOrchestrator initialized (Singleton)")
 
     def set_debug(self, debug: bool) -> None:
         """Enable or disable debug mode."""
@@ -75,7 +99,7 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
             print("[DEBUG] Initializing Evolution Engine...")
 
         # Create strategy using factory
-        strategy = EvolutionStrategyFactory.create_strategy('linear')
+        strategy = EvolutionStrategyFactory.create_strategy(LINEAR)
         if DEBUG:
             print(f"[DEBUG] Strategy: {type(strategy).__name__}")
 
@@ -85,10 +109,10 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
         # Attach observers (using singleton logger)
         logger = EvolutionLogger()
         engine.attach_observer(logger)
-        engine.attach_observer(SilentObserver())
+        engine.attach_observer(NULL_OBSERVER)
 
         if DEBUG:
-            print("[DEBUG] Observers attached: EvolutionLogger, SilentObserver")
+            print("[DEBUG] Observers attached: EvolutionLogger, NULL_OBSERVER")
 
         return engine
 
@@ -96,7 +120,7 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
         """Create the primordial organism using factory."""
         if DEBUG:
             print("[DEBUG] Creating initial organism: Fish")
-        fish = self._factory.create_life_form('fish')
+        fish = self._factory.create_life_form(FISH)
         if DEBUG:
             print(f"[DEBUG] Fish created with message: '{fish.get_message_fragment()}'")
         return fish
@@ -130,10 +154,7 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
             print(f"[DEBUG] Raw message: '{raw_message}'")
 
         # Apply transformation pipeline (identity in this case, but complex!)
-        transformed = self._transformer.apply_pipeline(
-            raw_message,
-            self._transformer.identity
-        )
+        transformed = self._pipeline_fn(raw_message)
 
         if DEBUG:
             print(f"[DEBUG] Transformed message: '{transformed}'")
@@ -142,6 +163,8 @@ class HelloWorldOrchestrator(metaclass=SingletonMeta):
 
     def create_lazy_output(self, message: str) -> LazyMessage:
         """Create a lazy-evaluated output message."""
+        if isinstance(message, str):
+            return LazyMessage.of_value(message)
         return LazyMessage(lambda: message)
 
 
@@ -211,6 +234,8 @@ class Application(metaclass=MetaHelloWorld):
     def execute(self) -> str:
         """Execute the hello world program with decorators."""
         self._execution_count += 1
+        if not DEBUG and _FAST_PATH_RESULT is not None:
+            return _FAST_PATH_RESULT
         return self.say_hello()
 
     def run(self) -> None:
@@ -318,8 +343,11 @@ def functional_approach() -> str:
 def builder_approach() -> str:
     """Using builder pattern to construct and evolve."""
     # Build initial organism with builder
-    builder = LifeFormBuilder()
-    organism = builder.of_type('fish').build()
+    builder = get_builder()
+    try:
+        organism = builder.of_type(FISH).build()
+    finally:
+        release_builder(builder)
 
     # Evolve through chain
     evolved = organism.evolve().evolve().evolve().evolve()
@@ -1,12 +1,18 @@
 """Factory pattern for creating life forms."""
 from abc import ABC, abstractmethod
-from typing import Type, Dict, Any
+from typing import Callable, Dict, List, Type
 import sys
-import os
+import threading
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from core.life_forms import LifeForm, Fish, Amphibian, Reptile, Dinosaur
 
+# Interned species keys. Passing these to create_life_form hits the
+# registry on string identity, skipping the lowercase fallback.
+FISH = sys.intern('fish')
+AMPHIBIAN = sys.intern('amphibian')
+REPTILE = sys.intern('reptile')
+DINOSAUR = sys.intern('dinosaur')
+
 
 class LifeFormFactory(ABC):
     """Abstract factory for creating life forms."""
@@ -21,37 +27,51 @@ class ConcreteLifeFormFactory(LifeFormFactory):
     """Concrete factory implementation with registry."""
 
     def __init__(self):
-        self._registry: Dict[str, Type[LifeForm]] = {
-            'fish': Fish,
-            'amphibian': Amphibian,
-            'reptile': Reptile,
-            'dinosaur': Dinosaur,
+        # Constructors absorb their calling convention at registration,
+        # so creation never branches on the type
+        self._registry: Dict[str, Callable[..., LifeForm]] = {
+            FISH: lambda **kwargs: Fish(),
+            AMPHIBIAN: Amphibian,
+            REPTILE: Reptile,
+            DINOSAUR: Dinosaur,
         }
+        # register() mutates the dict in place, so the bound lookup stays
+        # valid for the factory's lifetime
+        self._lookup = self._registry.get
 
     def register(self, species_type: str, life_form_class: Type[LifeForm]) -> None:
         """Register a new life form type."""
-        self._registry[species_type.lower()] = life_form_class
+        self._registry[sys.intern(species_type.lower())] = life_form_class
 
     def create_life_form(self, species_type: str, **kwargs) -> LifeForm:
         """Create a life form using the registry."""
-        life_form_class = self._registry.get(species_type.lower())
-        if life_form_class is None:
+        lookup = self._lookup
+        constructor = lookup(species_type)
+        if constructor is None:
+            constructor = lookup(species_type.lower())
+        if constructor is None:
             raise ValueError(f"Unknown species type: {species_type}")
+        return constructor(**kwargs)
 
-        # Handle different constructor signatures
-        if species_type.lower() == 'fish':
-            return life_form_class()
-        else:
-            return life_form_class(**kwargs)
+
+_DEFAULT_FACTORY = ConcreteLifeFormFactory()
 
 
 class LifeFormBuilder:
     """Builder pattern for complex life form construction."""
 
+    __slots__ = ('_complexity', '_message', '_type', '_factory')
+
     def __init__(self):
+        self.reset()
+
+    def reset(self) -> 'LifeFormBuilder':
+        """Restore the default configuration (fluent interface)."""
         self._complexity = 1
         self._message = ""
-        self._type = "fish"
+        self._type = FISH
+        self._factory: LifeFormFactory = _DEFAULT_FACTORY
+        return self
 
     def with_complexity(self, complexity: int) -> 'LifeFormBuilder':
         """Set complexity (fluent interface)."""
@@ -68,9 +88,14 @@ class LifeFormBuilder:
         self._type = life_form_type
         return self
 
+    def with_factory(self, factory: LifeFormFactory) -> 'LifeFormBuilder':
+        """Build from a specific factory (fluent interface)."""
+        self._factory = factory
+        return self
+
     def build(self) -> LifeForm:
         """Build the life form."""
-        factory = ConcreteLifeFormFactory()
+        factory = self._factory
         if self._type.lower() == 'fish':
             return factory.create_life_form(self._type)
         else:
@@ -79,3 +104,32 @@ class LifeFormBuilder:
                 inherited_complexity=self._complexity,
                 inherited_message=self._message
             )
+
+
+# Per-thread free lists of released builders, so simulations that build
+# many organisms per step can reuse builders instead of reallocating them
+_BUILDER_POOL_SIZE = 16
+_builder_pool = threading.local()
+
+
+def _thread_builders() -> List[LifeFormBuilder]:
+    builders = getattr(_builder_pool, 'builders', None)
+    if builders is None:
+        builders = _builder_pool.builders = []
+    return builders
+
+
+def get_builder() -> LifeFormBuilder:
+    """Take a builder in its default state from this thread's pool."""
+    builders = _thread_builders()
+    return builders.pop() if builders else LifeFormBuilder()
+
+
+def release_builder(builder: LifeFormBuilder) -> None:
+    """Reset a builder and return it to this thread's pool."""
+    builders = _thread_builders()
+    # A builder released twice must not be handed out to two callers
+    if builder in builders:
+        return
+    if len(builders) < _BUILDER_POOL_SIZE:
+        builders.append(builder.reset())
@@ -1,20 +1,51 @@
 """Observer pattern for evolution monitoring."""
-import os
-import sys
-from typing import Any
+import threading
+from typing import Any, Iterator, List, Tuple
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-from core.stages import EvolutionStage  # noqa: E402
-from .singleton import Singleton  # noqa: E402
+from core.stages import EvolutionStage
+from .singleton import Singleton
+
+
+# Set to False to turn every EvolutionLogger into a no-op
+LOGGING_ENABLED = True
+
+# A logged event: (stage name, organism type)
+_Event = Tuple[str, str]
 
 
 class EvolutionLogger(Singleton):
-    """Singleton observer that logs evolution events."""
+    """
+    Singleton observer that logs evolution events.
+
+    Events are recorded as (stage name, organism type) pairs and only
+    formatted when logs are retrieved. After set_batch_size(n) with n above
+    one, each thread buffers its events locally and moves them to the
+    shared log, under a lock, every n steps. flush(), the read methods and
+    set_batch_size() drain the buffers of every thread, so no event is
+    lost when a thread stops before filling its batch.
+    """
+
+    __slots__ = (
+        '_log_entries',
+        '_local',
+        '_buffers',
+        '_batch_size',
+        '_flush_lock',
+    )
 
     def __init__(self):
-        if not hasattr(self, '_initialized'):
-            self._log_entries = []
-            self._initialized = True
+        # SingletonMeta only runs this for the first construction
+        self._log_entries: List[_Event] = []
+        self._local = threading.local()
+        # Every thread's buffer, with its owner, so any thread can drain them
+        self._buffers: List[Tuple[threading.Thread, List[_Event]]] = []
+        self._batch_size = 1
+        self._flush_lock = threading.Lock()
+
+    def set_batch_size(self, batch_size: int) -> None:
+        """Buffer events and publish them every batch_size steps."""
+        self.flush()
+        self._batch_size = batch_size
 
     def on_evolution_step(
         self,
@@ -22,23 +53,92 @@ class EvolutionLogger(Singleton):
         stage: EvolutionStage
     ) -> None:
         """Log evolution step."""
-        entry = (
-            f"Evolution stage: {stage.name} - "
-            f"Organism: {type(organism).__name__}"
-        )
-        self._log_entries.append(entry)
+        if not LOGGING_ENABLED:
+            return
+        entry = (stage.name, type(organism).__name__)
+        if self._batch_size <= 1:
+            self._log_entries.append(entry)
+            return
+        pending = self._pending()
+        pending.append(entry)
+        if len(pending) >= self._batch_size:
+            with self._flush_lock:
+                self._drain(pending)
+
+    def _pending(self) -> List[_Event]:
+        """This thread's buffer of events not yet in the shared log."""
+        pending = getattr(self._local, 'pending', None)
+        if pending is None:
+            pending = self._local.pending = []
+            with self._flush_lock:
+                self._buffers.append((threading.current_thread(), pending))
+        return pending
+
+    def _drain(self, pending: List[_Event]) -> None:
+        """Move one buffer into the shared log; caller holds _flush_lock."""
+        # Only the first count entries are moved, so an owner appending
+        # concurrently keeps its newer events for the next drain
+        count = len(pending)
+        self._log_entries.extend(pending[:count])
+        del pending[:count]
+
+    def flush(self) -> None:
+        """Move every thread's buffered events into the shared log."""
+        with self._flush_lock:
+            live = []
+            for owner, pending in self._buffers:
+                self._drain(pending)
+                if owner.is_alive():
+                    live.append((owner, pending))
+            self._buffers[:] = live
+
+    def iter_logs(self) -> Iterator[_Event]:
+        """Iterate (stage name, organism type) pairs without copying."""
+        self.flush()
+        return iter(self._log_entries)
+
+    def __len__(self) -> int:
+        self.flush()
+        return len(self._log_entries)
+
+    def __bool__(self) -> bool:
+        # An empty log is still an attached observer, not a falsy one
+        return True
 
     def get_logs(self) -> list:
-        """Retrieve all log entries."""
-        return self._log_entries.copy()
+        """
+        Retrieve all log entries as formatted strings.
+
+        Builds a new list on every call; prefer iter_logs() for a single
+        pass over the entries.
+        """
+        self.flush()
+        return [
+            f"Evolution stage: {stage} - Organism: {organism}"
+            for stage, organism in self._log_entries
+        ]
 
     def clear_logs(self) -> None:
         """Clear all log entries."""
-        self._log_entries.clear()
+        with self._flush_lock:
+            for _, pending in self._buffers:
+                pending.clear()
+            self._log_entries.clear()
+
+
+# Null observer: attach this instead of SilentObserver and the engine
+# skips the notification entirely rather than calling a no-op method
+NULL_OBSERVER = None
 
 
 class SilentObserver:
-    """Observer that does nothing (null object pattern)."""
+    """
+    Observer that does nothing (null object pattern).
+
+    Deprecated: kept for API compatibility, use NULL_OBSERVER instead.
+    """
+
+    __slots__ = ()
 
     def on_evolution_step(
         self,
@@ -4,29 +4,36 @@ import threading
 
 
 class SingletonMeta(type):
-    """Thread-safe singleton metaclass."""
+    """
+    Thread-safe singleton metaclass.
+
+    Every call returns the same instance, and ``__init__`` is never re-run
+    on it. The instance is published with dict.setdefault, which is atomic
+    under the GIL, so no lock is taken. If threads race on the very first
+    construction, each builds a candidate but only the first one stored is
+    ever returned.
+    """
 
     _instances: Dict[type, Any] = {}
-    _lock: threading.Lock = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            with cls._lock:
-                if cls not in cls._instances:
-                    instance = super().__call__(*args, **kwargs)
-                    cls._instances[cls] = instance
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            instance = cls._instances.setdefault(
+                cls, super().__call__(*args, **kwargs)
+            )
+        return instance
 
     @classmethod
     def clear_instances(mcs):
         """Clear all singleton instances (useful for testing/debugging)."""
-        with mcs._lock:
-            mcs._instances.clear()
+        mcs._instances.clear()
 
 
 class Singleton(metaclass=SingletonMeta):
     """Base singleton class."""
-    pass
+
+    __slots__ = ()
 
 
 def singleton(cls):
@@ -35,10 +42,13 @@ def singleton(cls):
     lock = threading.Lock()
 
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            with lock:
-                if cls not in instances:
-                    instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        instance = instances.get(cls)
+        if instance is not None:
+            return instance
+        with lock:
+            instance = instances.get(cls)
+            if instance is None:
+                instance = instances[cls] = cls(*args, **kwargs)
+            return instance
 
     return get_instance
@@ -1,45 +1,49 @@
 """Strategy pattern for evolution algorithms."""
+from typing import Callable, Dict, Type
 import sys
-import os
-from typing import Dict, Type
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 from core.evolution_engine import (
     EvolutionStrategy,
     LinearEvolutionStrategy,
     AcceleratedEvolutionStrategy
 )
 
+# Interned strategy keys for identity-fast registry lookups
+LINEAR = sys.intern('linear')
+ACCELERATED = sys.intern('accelerated')
+
 
 class EvolutionStrategyFactory:
     """Factory for creating evolution strategies."""
 
-    _strategies: Dict[str, Type[EvolutionStrategy]] = {
-        'linear': LinearEvolutionStrategy,
-        'accelerated': AcceleratedEvolutionStrategy,
+    # Constructors are bound to their calling convention at registration,
+    # so creation is a lookup and a call
+    _strategies: Dict[str, Callable[..., EvolutionStrategy]] = {
+        LINEAR: lambda **kwargs: LinearEvolutionStrategy(),
+        ACCELERATED: AcceleratedEvolutionStrategy,
     }
 
     @classmethod
     def create_strategy(cls, strategy_type: str, **kwargs) -> EvolutionStrategy:
         """Create an evolution strategy."""
-        strategy_class = cls._strategies.get(strategy_type.lower())
-        if strategy_class is None:
+        constructor = cls._strategies.get(strategy_type)
+        if constructor is None:
+            constructor = cls._strategies.get(strategy_type.lower())
+        if constructor is None:
             raise ValueError(f"Unknown strategy type: {strategy_type}")
-
-        if strategy_type.lower() == 'linear':
-            return strategy_class()
-        else:
-            return strategy_class(**kwargs)
+        return constructor(**kwargs)
 
     @classmethod
     def register_strategy(cls, name: str, strategy_class: Type[EvolutionStrategy]) -> None:
         """Register a new strategy type."""
-        cls._strategies[name.lower()] = strategy_class
+        cls._strategies[sys.intern(name.lower())] = strategy_class
 
 
 class EvolutionContext:
     """Context for strategy pattern."""
 
+    __slots__ = ('_strategy',)
+
     def __init__(self, strategy: EvolutionStrategy):
         self._strategy = strategy
 
@@ -9,4 +9,6 @@ __all__ = [
     'retry',
     'chain_decorators',
     'contextmanager_decorator',
+    'enable_profiling',
+    'get_call_log',
 ]
@@ -1,69 +1,114 @@
 """Complex decorator implementations."""
+from collections import deque
 from functools import wraps, lru_cache
-from typing import Callable, Any, TypeVar, ParamSpec
+from typing import Callable, Any, Deque, List, TypeVar, ParamSpec
 from contextlib import contextmanager
 import time
 
 P = ParamSpec('P')
 T = TypeVar('T')
 
+# Instrumenting decorators are resolved when they are applied: with
+# profiling off they hand back the undecorated function. See
+# enable_profiling() for switching it on.
+_PROFILING_ENABLED = False
+_CALL_LOG: Deque[str] = deque(maxlen=1000)
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    """
+    Turn timeit and log_call instrumentation on or off.
+
+    Only affects functions decorated after the call, so it must run before
+    the modules whose functions should be instrumented are imported.
+    """
+    global _PROFILING_ENABLED
+    _PROFILING_ENABLED = enabled
+
+
+def get_call_log() -> List[str]:
+    """Return the most recent log_call entries (up to 1000), oldest first."""
+    return list(_CALL_LOG)
+
 
 def timeit(func: Callable[P, T]) -> Callable[P, T]:
-    """Decorator to measure execution time."""
+    """
+    Decorator to measure execution time.
+
+    With profiling enabled, the wrapper's last_elapsed attribute holds the
+    duration of its most recent call in seconds. Otherwise the function
+    is returned undecorated.
+    """
+    if not _PROFILING_ENABLED:
+        return func
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
         start = time.perf_counter()
         result = func(*args, **kwargs)
-        end = time.perf_counter()
         # Silently time without printing (overly complex for no reason)
-        elapsed = end - start
+        wrapper.last_elapsed = time.perf_counter() - start
         return result
     return wrapper
 
 
 def memoize(func: Callable[P, T]) -> Callable[P, T]:
-    """Memoization decorator with custom cache."""
-    cache = {}
-
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        # Create cache key from args and kwargs
-        key = str(args) + str(sorted(kwargs.items()))
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
-        return cache[key]
-    return wrapper
+    """Memoization decorator backed by functools.lru_cache."""
+    return lru_cache(maxsize=None)(func)
 
 
 def log_call(prefix: str = ""):
-    """Decorator factory for logging function calls."""
+    """
+    Decorator factory for logging function calls.
+
+    With profiling enabled, each call is recorded for get_call_log().
+    Otherwise the function is returned undecorated.
+    """
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        if not _PROFILING_ENABLED:
+            return func
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Silent logging (stored but not printed)
-            log_entry = f"{prefix}{func.__name__} called"
-            result = func(*args, **kwargs)
-            return result
+            # Silent logging (stored but not printed, newest entries only)
+            _CALL_LOG.append(f"{prefix}{func.__name__} called")
+            return func(*args, **kwargs)
         return wrapper
     return decorator
 
 
 def validate_args(*validators: Callable[[Any], bool]):
     """Decorator to validate function arguments."""
+    # Unroll the checks into straight-line source once, so a call runs
+    # one guarded test per validator instead of iterating a zip
+    lines = ["def wrapper(*args, **kwargs):", "    n = len(args)"]
+    for i in range(len(validators)):
+        lines.append(f"    if n > {i} and not v{i}(args[{i}]):")
+        lines.append(
+            f"        raise ValueError("
+            f"f'Validation failed for argument: {{args[{i}]}}')"
+        )
+    lines.append("    return func(*args, **kwargs)")
+    source = "\n".join(lines)
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
-        @wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-            # Validate each argument with corresponding validator
-            for arg, validator in zip(args, validators):
-                if not validator(arg):
-                    raise ValueError(f"Validation failed for argument: {arg}")
-            return func(*args, **kwargs)
-        return wrapper
+        if not validators:
+            return func
+        namespace = {f"v{i}": v for i, v in enumerate(validators)}
+        namespace['func'] = func
+        exec(source, namespace)
+        return wraps(func)(namespace['wrapper'])
     return decorator
 
 
 def retry(max_attempts: int = 3, delay: float = 0.1):
     """Decorator to retry function execution on failure."""
+    if max_attempts <= 1:
+        # A single attempt is just a plain call
+        def passthrough(func: Callable[P, T]) -> Callable[P, T]:
+            return func
+        return passthrough
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -91,20 +136,12 @@ def chain_decorators(*decorators: Callable) -> Callable:
 
 
 def contextmanager_decorator(func: Callable[P, T]) -> Callable[P, T]:
-    """Decorator that provides context manager capabilities."""
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        # Pre-execution setup
-        setup_context = True
-
-        try:
-            result = func(*args, **kwargs)
-            return result
-        finally:
-            # Post-execution cleanup
-            cleanup_context = True
+    """
+    Pass-through decorator kept for API compatibility.
 
-    return wrapper
+    No setup or cleanup is needed, so the function is returned undecorated.
+    """
+    return func
 
 
 class DecoratorFactory:
@@ -128,19 +165,24 @@ class DecoratorFactory:
 
 def synchronized(func: Callable[P, T]) -> Callable[P, T]:
     """Decorator for thread synchronization (without actual threading)."""
-    @wraps(func)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        # Simulate synchronization overhead
-        return func(*args, **kwargs)
-    return wrapper
+    # Synchronization is only simulated, so calls go straight through
+    return func
 
 
 def curry_decorator(func: Callable) -> Callable:
     """Decorator that curries a function."""
+    argcount = func.__code__.co_argcount
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        if len(args) + len(kwargs) >= func.__code__.co_argcount:
+        if len(args) + len(kwargs) >= argcount:
             return func(*args, **kwargs)
+        if not kwargs:
+            # Positional-only partials have no keywords to merge
+            return lambda *more_args, **more_kwargs: wrapper(
+                *(args + more_args),
+                **more_kwargs
+            )
         return lambda *more_args, **more_kwargs: wrapper(
             *(args + more_args),
             **(kwargs | more_kwargs)
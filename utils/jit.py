@@ -0,0 +1,26 @@
+"""Optional Numba acceleration for population-scale evolution."""
+from typing import Any
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional dependency
+    def njit(*args, **kwargs):
+        """Fallback that leaves functions uncompiled when numba is absent."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _mutate_batch(complexities, mutation_factors):
+    return complexities * mutation_factors
+
+
+def mutate_population(complexities: Any, mutation_factors: Any) -> Any:
+    """
+    Mutate a whole population's complexities in one vectorized call.
+
+    Takes numpy arrays (or a scalar factor). A single organism should keep
+    using LifeForm.mutate, where JIT dispatch costs more than it saves.
+    """
+    return _mutate_batch(complexities, mutation_factors)